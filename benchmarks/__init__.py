@@ -0,0 +1,8 @@
+"""
+Performance benchmarks for kaggle_utils and the discussion scraper.
+
+Run from the repository root:
+
+    uv run python -m benchmarks.run_benchmarks                  # compare with baseline
+    uv run python -m benchmarks.run_benchmarks --save-baseline  # record a new baseline
+"""
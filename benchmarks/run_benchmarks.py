@@ -0,0 +1,354 @@
+"""
+Benchmark runner for kaggle_utils reporting, discussions, metrics and CLI startup.
+
+Each case builds its seeded synthetic input once, then measures the hot
+path: wall time is the best of ``--repeat`` runs, peak memory is taken
+from a separate run under ``tracemalloc``. Results are compared with a
+stored baseline and the process exits non-zero on a regression.
+
+Usage:
+    uv run python -m benchmarks.run_benchmarks                  # Compare with baseline
+    uv run python -m benchmarks.run_benchmarks --save-baseline  # Record baseline
+    uv run python -m benchmarks.run_benchmarks --scale 0.1      # Quick smoke run
+    uv run python -m benchmarks.run_benchmarks --only forum     # Subset of cases
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+
+@dataclass
+class Case:
+    """A named benchmark: ``setup(scale, workdir)`` returns the callable to time.
+
+    ``track_memory=False`` skips peak memory for cases whose work happens in a
+    subprocess, where tracemalloc would only see the parent's overhead.
+    """
+
+    name: str
+    setup: Callable[[float, Path], Callable[[], object]]
+    track_memory: bool = True
+
+
+def _scaled(n: int, scale: float) -> int:
+    return max(1, int(n * scale))
+
+
+# ---------------------------------------------------------------------------
+# Cases
+# ---------------------------------------------------------------------------
+
+
+def _summary_wide(scale: float, workdir: Path) -> Callable[[], object]:
+    from kaggle_utils.reporting import create_data_summary
+
+    from .synthetic import make_frame
+
+    df = make_frame(_scaled(2_000, scale), _scaled(1_000, scale), 20, seed=1)
+    return lambda: create_data_summary(df, workdir / "summary_wide.md")
+
+
+def _summary_tall(scale: float, workdir: Path) -> Callable[[], object]:
+    from kaggle_utils.reporting import create_data_summary
+
+    from .synthetic import make_frame
+
+    df = make_frame(_scaled(1_000_000, scale), 20, 5, seed=2)
+    return lambda: create_data_summary(df, workdir / "summary_tall.md")
+
+
+def _report_large(scale: float, workdir: Path) -> Callable[[], object]:
+    from kaggle_utils.reporting import generate_full_report
+
+    from .synthetic import make_feature_importance, make_history
+
+    # 5 folds x 20k LightGBM rounds
+    metrics = {
+        "val_score": 0.8123,
+        "train_time": 3600.0,
+        "val_auc": 0.8123,
+        "history": make_history(_scaled(100_000, scale), seed=3),
+    }
+    config = {"model_type": "lightgbm", "n_folds": 5, "num_boost_round": 20_000}
+    importance = make_feature_importance(_scaled(10_000, scale), seed=4)
+    return lambda: generate_full_report(
+        "bench",
+        metrics,
+        config,
+        feature_importance=importance,
+        output_path=workdir / "report.md",
+    )
+
+
+def _report_evals_result(scale: float, workdir: Path) -> Callable[[], object]:
+    from kaggle_utils.reporting import generate_full_report
+
+    from .synthetic import make_evals_result
+
+    # LightGBM evals_result_ of a 20k-round run
+    metrics = {
+        "val_score": 0.8123,
+        "history": make_evals_result(_scaled(20_000, scale), seed=8),
+    }
+    config = {"model_type": "lightgbm", "num_boost_round": 20_000}
+    return lambda: generate_full_report(
+        "bench", metrics, config, output_path=workdir / "report_evals.md"
+    )
+
+
+def _forum(
+    scale: float,
+) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
+    from .synthetic import make_forum
+
+    return make_forum(n_topics=_scaled(10_000, scale), max_depth=200, seed=5)
+
+
+def _flatten_forum(scale: float, workdir: Path) -> Callable[[], object]:
+    from kaggle_utils import discussions as scraper
+
+    details, _ = _forum(scale)
+    return lambda: [
+        scraper.flatten_comments(d.get("comments", [])) for d in details.values()
+    ]
+
+
+def _format_forum(scale: float, workdir: Path) -> Callable[[], object]:
+    from kaggle_utils import discussions as scraper
+
+    details, meta = _forum(scale)
+    return lambda: [
+        scraper.format_discussion_markdown(d, meta.get(tid))
+        for tid, d in details.items()
+    ]
+
+
+def _save_forum(scale: float, workdir: Path) -> Callable[[], object]:
+    from kaggle_utils import discussions as scraper
+
+    details, meta = _forum(scale)
+    output_dir = workdir / "discussions"
+    output_dir.mkdir(exist_ok=True)
+
+    def run() -> None:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            scraper.save_outputs(details, meta, output_dir, "synthetic")
+
+    return run
+
+
+def _bootstrap_auc(scale: float, workdir: Path) -> Callable[[], object]:
+    import numpy as np
+
+    from kaggle_utils.metrics import paired_bootstrap
+
+    rng = np.random.default_rng(7)
+    n = _scaled(100_000, scale)
+    y = rng.integers(0, 2, n)
+    oof_a = np.clip(0.3 * y + 0.7 * rng.random(n), 0, 1)
+    oof_b = np.clip(oof_a + 0.01 * (y - 0.5), 0, 1)
+    return lambda: paired_bootstrap("auc", y, oof_a, oof_b, n_resamples=200)
+
+
+def _cli(argv: list[str], workdir: Path) -> Callable[[], object]:
+    # Cold start in a fresh interpreter; only wall time is compared
+    cmd = [sys.executable, "-m", "kaggle_utils", *argv]
+    return lambda: subprocess.run(
+        cmd, cwd=workdir, stdout=subprocess.DEVNULL, check=True
+    )
+
+
+def _cli_help(scale: float, workdir: Path) -> Callable[[], object]:
+    return _cli(["--help"], workdir)
+
+
+def _cli_report(scale: float, workdir: Path) -> Callable[[], object]:
+    from .synthetic import make_history
+
+    metrics_path = workdir / "metrics.json"
+    with open(metrics_path, "w", encoding="utf-8") as f:
+        json.dump({"val_score": 0.8123, "history": make_history(1_000, seed=6)}, f)
+    return _cli(
+        [
+            "report",
+            "bench",
+            "--metrics",
+            str(metrics_path),
+            "--output",
+            str(workdir / "cli_report.md"),
+        ],
+        workdir,
+    )
+
+
+CASES = [
+    Case("create_data_summary/wide", _summary_wide),
+    Case("create_data_summary/tall", _summary_tall),
+    Case("generate_full_report/large_history", _report_large),
+    Case("generate_full_report/evals_result", _report_evals_result),
+    Case("forum/flatten_comments", _flatten_forum),
+    Case("forum/format_discussion_markdown", _format_forum),
+    Case("forum/save_outputs", _save_forum),
+    Case("metrics/paired_bootstrap_auc", _bootstrap_auc),
+    Case("cli/startup/help", _cli_help, track_memory=False),
+    Case("cli/startup/report", _cli_report, track_memory=False),
+]
+
+
+# ---------------------------------------------------------------------------
+# Measurement and baseline comparison
+# ---------------------------------------------------------------------------
+
+
+def measure(
+    fn: Callable[[], object], repeat: int, track_memory: bool = True
+) -> dict[str, float]:
+    """Return best wall time (s) over ``repeat`` runs and traced peak memory (MB)."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    if not track_memory:
+        return {"seconds": min(timings)}
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"seconds": min(timings), "peak_mb": peak / 1e6}
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    time_tolerance: float,
+    memory_tolerance: float,
+) -> list[str]:
+    """Print a comparison table and return the names of regressed cases."""
+    regressions = []
+    print(f"\n{'Case':<40} {'Time':>10} {'vs base':>9} {'Peak MB':>10} {'vs base':>9}")
+    for name, res in results.items():
+        base = baseline.get(name)
+        peak = f"{res['peak_mb']:>10.1f}" if "peak_mb" in res else f"{'-':>10}"
+        if base is None:
+            print(f"{name:<40} {res['seconds']:>9.3f}s {'new':>9} {peak} {'new':>9}")
+            continue
+        t_ratio = res["seconds"] / base["seconds"] if base["seconds"] else 1.0
+        m_ratio = None
+        if "peak_mb" in res and base.get("peak_mb"):
+            m_ratio = res["peak_mb"] / base["peak_mb"]
+        flag = ""
+        if t_ratio > 1 + time_tolerance or (
+            m_ratio is not None and m_ratio > 1 + memory_tolerance
+        ):
+            flag = "  REGRESSION"
+            regressions.append(name)
+        m_col = f"{m_ratio:>8.2f}x" if m_ratio is not None else f"{'-':>9}"
+        print(
+            f"{name:<40} {res['seconds']:>9.3f}s {t_ratio:>8.2f}x {peak} {m_col}{flag}"
+        )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run kaggle_utils benchmarks")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Write results to the baseline file instead of comparing",
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiply all dataset sizes (e.g. 0.1 for a quick run)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case")
+    parser.add_argument("--only", default="", help="Run cases whose name contains this")
+    parser.add_argument(
+        "--time-tolerance",
+        type=float,
+        default=0.3,
+        help="Allowed relative slowdown before failing (0.3 = +30%%)",
+    )
+    parser.add_argument(
+        "--memory-tolerance",
+        type=float,
+        default=0.1,
+        help="Allowed relative peak memory growth before failing",
+    )
+    args = parser.parse_args()
+
+    baseline = None
+    if not args.save_baseline and args.baseline.exists():
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("scale") != args.scale:
+            parser.error(
+                f"baseline was recorded with --scale {baseline.get('scale')}, "
+                f"not {args.scale}"
+            )
+
+    results: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for case in CASES:
+            if args.only not in case.name:
+                continue
+            print(f"  {case.name} ...", flush=True)
+            fn = case.setup(args.scale, Path(tmp))
+            results[case.name] = measure(fn, args.repeat, case.track_memory)
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "createdAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                    "python": platform.python_version(),
+                    "machine": platform.platform(),
+                    "scale": args.scale,
+                    "cases": results,
+                },
+                f,
+                indent=2,
+            )
+        compare(results, {}, args.time_tolerance, args.memory_tolerance)
+        print(f"\nSaved baseline to {args.baseline}")
+        return
+
+    if baseline is None:
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline first.")
+        compare(results, {}, args.time_tolerance, args.memory_tolerance)
+        return
+
+    regressions = compare(
+        results, baseline.get("cases", {}), args.time_tolerance, args.memory_tolerance
+    )
+    if regressions:
+        print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+        sys.exit(1)
+    print("\nNo regressions.")
+
+
+if __name__ == "__main__":
+    main()
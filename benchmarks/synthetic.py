@@ -0,0 +1,210 @@
+"""
+Seeded synthetic data generators for the benchmark suite.
+
+Every generator takes an explicit ``seed`` so that two runs on the same
+machine measure exactly the same workload.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+_WORDS = (
+    "model feature fold leak target validation lightgbm xgboost catboost "
+    "ensemble stacking seed score public private leaderboard shake boost "
+    "encoding lag rolling mean std baseline tuning optuna submission"
+).split()
+
+
+def make_frame(
+    n_rows: int,
+    n_numeric: int,
+    n_categorical: int = 0,
+    missing_rate: float = 0.05,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    Create a mixed-type DataFrame with a numeric ``target`` column.
+
+    Args:
+        n_rows: Number of rows
+        n_numeric: Number of float feature columns
+        n_categorical: Number of object (string) feature columns
+        missing_rate: Fraction of numeric cells replaced with NaN
+        seed: Random seed
+
+    Returns:
+        Synthetic DataFrame
+    """
+    rng = np.random.default_rng(seed)
+    numeric = rng.standard_normal((n_rows, n_numeric))
+    if missing_rate > 0:
+        numeric[rng.random(numeric.shape) < missing_rate] = np.nan
+    df = pd.DataFrame(numeric, columns=[f"num_{i}" for i in range(n_numeric)])
+
+    vocab = np.array([f"cat_{i}" for i in range(50)], dtype=object)
+    for i in range(n_categorical):
+        df[f"cat_{i}"] = vocab[rng.integers(0, len(vocab), n_rows)]
+
+    df["target"] = rng.standard_normal(n_rows)
+    frame: pd.DataFrame = df
+    return frame
+
+
+def make_history(n_rounds: int, seed: int = 0) -> list[dict[str, float]]:
+    """
+    Create a per-round training history as a list of per-epoch dicts.
+
+    Args:
+        n_rounds: Number of boosting rounds
+        seed: Random seed
+
+    Returns:
+        List with one ``{"train_loss", "valid_loss"}`` dict per round
+    """
+    rng = np.random.default_rng(seed)
+    steps = np.arange(1, n_rounds + 1)
+    train = 1.0 / np.sqrt(steps) + rng.normal(0, 0.01, n_rounds)
+    valid = train + 0.05 + np.linspace(0, 0.1, n_rounds) ** 2
+    valid += rng.normal(0, 0.01, n_rounds)
+    return [
+        {"train_loss": float(t), "valid_loss": float(v)} for t, v in zip(train, valid)
+    ]
+
+
+def make_evals_result(
+    n_rounds: int, seed: int = 0
+) -> dict[str, dict[str, list[float]]]:
+    """
+    Create a training history in LightGBM's ``evals_result_`` shape.
+
+    Args:
+        n_rounds: Number of boosting rounds
+        seed: Random seed
+
+    Returns:
+        ``{"training": {"l2": [...]}, "valid_0": {"l2": [...], "auc": [...]}}``
+    """
+    rng = np.random.default_rng(seed)
+    steps = np.arange(1, n_rounds + 1)
+    train = 1.0 / np.sqrt(steps) + rng.normal(0, 0.01, n_rounds)
+    valid = train + 0.05 + np.linspace(0, 0.1, n_rounds) ** 2
+    auc = 0.9 - valid / 4 + rng.normal(0, 0.005, n_rounds)
+    return {
+        "training": {"l2": train.tolist()},
+        "valid_0": {"l2": valid.tolist(), "auc": auc.tolist()},
+    }
+
+
+def make_feature_importance(n_features: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Create a feature importance table sorted by importance.
+
+    Args:
+        n_features: Number of features
+        seed: Random seed
+
+    Returns:
+        DataFrame with columns ``feature`` and ``importance``
+    """
+    rng = np.random.default_rng(seed)
+    importance = np.sort(rng.exponential(1.0, n_features))[::-1]
+    frame: pd.DataFrame = pd.DataFrame(
+        {
+            "feature": [f"feature_{i}" for i in range(n_features)],
+            "importance": importance,
+        }
+    )
+    return frame
+
+
+def _make_comment(
+    rng: random.Random, comment_id: int, when: datetime
+) -> dict[str, Any]:
+    n_words = rng.randint(5, 120)
+    return {
+        "id": comment_id,
+        "authorDisplayName": f"user_{rng.randint(0, 5000)}",
+        "postDate": when.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+        "content": " ".join(rng.choice(_WORDS) for _ in range(n_words)),
+        "voteCount": rng.randint(0, 50),
+        "replies": [],
+    }
+
+
+def make_forum(
+    n_topics: int = 10_000,
+    comments_per_topic: int = 6,
+    max_depth: int = 50,
+    deep_every: int = 100,
+    seed: int = 0,
+) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
+    """
+    Create a synthetic forum in the shape produced by fetch_discussions.py.
+
+    Most topics get a shallow, bushy reply tree. Every ``deep_every``-th
+    topic additionally carries a single reply chain ``max_depth`` levels
+    deep to exercise the recursive flattening.
+
+    Args:
+        n_topics: Number of topics
+        comments_per_topic: Average number of comments per topic
+        max_depth: Depth of the long reply chains
+        deep_every: Period of topics that get a long reply chain (0 = none)
+        seed: Random seed
+
+    Returns:
+        Tuple of (details keyed by topic id, topic list metadata keyed by id)
+    """
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    details: dict[str, dict[str, Any]] = {}
+    meta: dict[str, dict[str, Any]] = {}
+    comment_id = 0
+
+    for tid in range(1, n_topics + 1):
+        when = start + timedelta(minutes=tid)
+        title = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(3, 10)))
+
+        roots: list[dict[str, Any]] = []
+        pool: list[dict[str, Any]] = []
+        for _ in range(max(1, int(rng.expovariate(1 / comments_per_topic)))):
+            comment_id += 1
+            comment = _make_comment(rng, comment_id, when)
+            # Attach to an existing comment half the time to grow bushy trees
+            if pool and rng.random() < 0.5:
+                rng.choice(pool)["replies"].append(comment)
+            else:
+                roots.append(comment)
+            pool.append(comment)
+
+        if deep_every and tid % deep_every == 0:
+            parent = roots[0]
+            for _ in range(max_depth):
+                comment_id += 1
+                child = _make_comment(rng, comment_id, when)
+                parent["replies"].append(child)
+                parent = child
+
+        details[str(tid)] = {
+            "id": tid,
+            "title": title,
+            "authorUserDisplayName": roots[0]["authorDisplayName"],
+            "dateCreated": roots[0]["postDate"],
+            "voteCount": rng.randint(0, 300),
+            "comments": roots,
+        }
+        meta[str(tid)] = {
+            "id": tid,
+            "title": title,
+            "postDate": roots[0]["postDate"],
+            "votes": details[str(tid)]["voteCount"],
+            "topicUrl": f"/competitions/synthetic/discussion/{tid}",
+        }
+
+    return details, meta
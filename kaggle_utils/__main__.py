@@ -0,0 +1,7 @@
+"""Allow ``python -m kaggle_utils``."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,180 @@
+"""
+Command-line entry point for kaggle_utils.
+
+Usage:
+    kaggle-utils summarize data/train.csv -o outputs/reports/eda_train.md
+    kaggle-utils report exp001 --metrics metrics.json --config config.json
+    kaggle-utils fetch-discussions --competition <slug>
+    kaggle-utils search "target leak" --input docs/discussions
+
+Heavy dependencies (pandas, numpy, requests, playwright) are imported inside
+the subcommand that needs them, so ``report`` without a feature importance
+table and ``search`` start without loading any of them.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
+
+class CliError(Exception):
+    """User-facing error reported as a one-line message by ``main``."""
+
+
+def _read_json(path: Optional[Path]) -> dict[str, Any]:
+    if path is None:
+        return {}
+    with open(path, encoding="utf-8") as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as exc:
+            raise CliError(f"{path}: {exc}") from exc
+    if not isinstance(data, dict):
+        raise CliError(f"{path}: expected a JSON object")
+    return data
+
+
+def _cmd_summarize(args: argparse.Namespace) -> int:
+    import pandas as pd
+
+    from .reporting import create_data_summary
+
+    path = Path(args.data)
+    suffix = path.suffix.lower()
+    if suffix in (".parquet", ".feather"):
+        read = pd.read_parquet if suffix == ".parquet" else pd.read_feather
+        try:
+            df = read(path)
+        except ImportError as exc:
+            raise CliError(
+                f"reading {suffix[1:].title()} files needs pyarrow: pip install pyarrow"
+            ) from exc
+        # Neither format supports a row limit on read
+        if args.nrows is not None:
+            df = df.head(args.nrows)
+    else:
+        df = pd.read_csv(path, nrows=args.nrows)
+
+    output = args.output or Path("outputs/reports") / f"summary_{path.stem}.md"
+    print(create_data_summary(df, output))
+    return 0
+
+
+def _cmd_report(args: argparse.Namespace) -> int:
+    from .reporting import generate_full_report
+
+    metrics = _read_json(args.metrics)
+    if args.history is not None:
+        from .history import HistoryRecorder
+
+        metrics["history"] = HistoryRecorder.load(args.history)
+
+    feature_importance = None
+    if args.feature_importance is not None:
+        import pandas as pd
+
+        feature_importance = pd.read_csv(args.feature_importance)
+
+    path = generate_full_report(
+        args.name,
+        metrics,
+        _read_json(args.config),
+        feature_importance=feature_importance,
+        plots_dir=args.plots_dir,
+        output_path=args.output,
+        history_buckets=args.history_buckets,
+    )
+    print(path)
+    return 0
+
+
+def _cmd_search(args: argparse.Namespace) -> int:
+    from .discussions import load_discussions, search_discussions
+
+    details, topic_meta = load_discussions(args.input)
+    hits = search_discussions(details, args.query, topic_meta, limit=args.limit)
+    for hit in hits:
+        print(
+            f"[{hit['id']}] {hit['title']} "
+            f"(votes: {hit['votes']}, matches: {hit['matches']})"
+        )
+        print(f"    {hit['snippet']}")
+    if not hits:
+        print("No matching topics.")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the ``kaggle-utils`` argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="kaggle-utils", description="Kaggle experiment utilities"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("summarize", help="Write a markdown summary of a dataset")
+    p.add_argument("data", type=Path, help="CSV, Parquet or Feather file")
+    p.add_argument("--output", "-o", type=Path, default=None)
+    p.add_argument(
+        "--nrows", type=int, default=None, help="Summarize only the first N rows"
+    )
+    p.set_defaults(func=_cmd_summarize)
+
+    p = sub.add_parser("report", help="Generate a full experiment report")
+    p.add_argument("name", help="Experiment name")
+    p.add_argument("--metrics", type=Path, default=None, help="Metrics JSON file")
+    p.add_argument("--config", type=Path, default=None, help="Config JSON file")
+    p.add_argument(
+        "--history", type=Path, default=None, help="HistoryRecorder .npz file"
+    )
+    p.add_argument("--history-buckets", type=int, default=20)
+    p.add_argument(
+        "--feature-importance",
+        type=Path,
+        default=None,
+        help="CSV with feature and importance columns",
+    )
+    p.add_argument("--plots-dir", type=Path, default=None)
+    p.add_argument("--output", "-o", type=Path, default=None)
+    p.set_defaults(func=_cmd_report)
+
+    # Listed for --help only; main() dispatches it before parsing
+    sub.add_parser("fetch-discussions", help="Fetch Kaggle competition discussions")
+
+    p = sub.add_parser("search", help="Search fetched discussions")
+    p.add_argument("query")
+    p.add_argument("--input", "-i", type=Path, default=Path("docs/discussions"))
+    p.add_argument("--limit", type=int, default=20, help="Max results (0 = all)")
+    p.set_defaults(func=_cmd_search)
+
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run the CLI and return the exit code."""
+    argv = sys.argv[1:] if argv is None else argv
+
+    # The scraper owns its options; hand them over untouched.
+    if argv[:1] == ["fetch-discussions"]:
+        from .discussions import build_parser as build_fetch_parser
+        from .discussions import run
+
+        fetch_parser = build_fetch_parser(
+            argparse.ArgumentParser(prog="kaggle-utils fetch-discussions")
+        )
+        run(fetch_parser.parse_args(argv[1:]), fetch_parser)
+        return 0
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        return int(args.func(args))
+    except FileNotFoundError as exc:
+        parser.error(f"{exc.filename}: no such file or directory")
+    except CliError as exc:
+        parser.error(str(exc))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,349 @@
+"""
+Dependency-aware feature cache for the feature engineering stage.
+
+Each feature is a function registered with the raw columns and other
+features it reads. Its output is stored as one ``.npy`` file per split,
+keyed by a hash of the function source and of its inputs, so a rerun only
+recomputes features whose code or inputs changed. Independent features are
+computed in parallel, and training code memory-maps just the columns it
+asks for instead of re-reading a processed CSV.
+
+Example:
+    store = FeatureStore("data/features")
+
+    @store.feature(inputs=["SibSp", "Parch"])
+    def family_size(df):
+        return df["SibSp"] + df["Parch"] + 1
+
+    @store.feature(deps=["family_size"])
+    def is_alone(df):
+        return (df["family_size"] == 1).astype("int8")
+
+    store.build(train_df, split="train")
+    X = store.load(["family_size", "is_alone"], split="train")
+"""
+
+import hashlib
+import inspect
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import CodeType
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+import numpy as np
+import pandas as pd
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class FeatureSpec:
+    """A registered feature function and what it reads."""
+
+    name: str
+    func: Callable[[pd.DataFrame], Any]
+    inputs: List[str] = field(default_factory=list)
+    deps: List[str] = field(default_factory=list)
+    version: str = ""
+
+    @property
+    def source_hash(self) -> str:
+        """Hash of the function source (falls back to its compiled code)."""
+        try:
+            source = inspect.getsource(self.func)
+        except (OSError, TypeError):
+            # exec'd code, ``python -`` and some REPLs have no source file
+            code = getattr(self.func, "__code__", None)
+            if code is None:
+                if self.version:
+                    # The explicit version is part of the cache key
+                    return ""
+                raise TypeError(
+                    f"Cannot fingerprint feature '{self.name}'; pass version= "
+                    "and bump it when the function changes"
+                ) from None
+            defaults = (
+                getattr(self.func, "__defaults__", None),
+                getattr(self.func, "__kwdefaults__", None),
+            )
+            source = _code_fingerprint(code) + _stable_repr(defaults)
+        return hashlib.sha256(source.encode()).hexdigest()[:16]
+
+
+def _stable_repr(value: Any) -> str:
+    # frozenset/dict order depends on string hashing, which varies per process
+    if isinstance(value, (frozenset, set)):
+        return "{" + ",".join(sorted(_stable_repr(v) for v in value)) + "}"
+    if isinstance(value, dict):
+        items = sorted(f"{_stable_repr(k)}:{_stable_repr(v)}" for k, v in value.items())
+        return "{" + ",".join(items) + "}"
+    if isinstance(value, (tuple, list)):
+        return "(" + ",".join(_stable_repr(v) for v in value) + ")"
+    if isinstance(value, CodeType):
+        return _code_fingerprint(value)
+    return repr(value)
+
+
+def _code_fingerprint(code: CodeType) -> str:
+    """Bytecode, names and constants of ``code`` and its nested functions."""
+    return "|".join(
+        [
+            code.co_code.hex(),
+            _stable_repr(code.co_names),
+            _stable_repr(code.co_varnames),
+            _stable_repr(code.co_consts),
+        ]
+    )
+
+
+def _hash_column(series: pd.Series) -> str:
+    hashed = pd.util.hash_pandas_object(series, index=False).to_numpy()
+    return hashlib.sha256(hashed.tobytes()).hexdigest()[:16]
+
+
+class FeatureStore:
+    """Registry of feature functions with a per-column on-disk cache."""
+
+    def __init__(self, cache_dir: str = "data/features", n_jobs: int = -1):
+        """
+        Initialize the store.
+
+        Args:
+            cache_dir: Directory holding one subdirectory per split
+            n_jobs: Threads for computing independent features (-1 = all CPUs)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.n_jobs = n_jobs
+        self.specs: Dict[str, FeatureSpec] = {}
+
+    def feature(
+        self,
+        name: Optional[str] = None,
+        inputs: Sequence[str] = (),
+        deps: Sequence[str] = (),
+        version: str = "",
+    ) -> Callable[[F], F]:
+        """
+        Register a feature function.
+
+        The function receives a DataFrame with the ``inputs`` columns and the
+        ``deps`` features, and returns one value per row (Series or array).
+
+        Args:
+            name: Feature name (defaults to the function name)
+            inputs: Raw columns the function reads
+            deps: Other registered features the function reads
+            version: Bump to force recomputation without a code change
+
+        Returns:
+            Decorator that registers and returns the function unchanged
+        """
+
+        def decorator(func: F) -> F:
+            spec_name = name or func.__name__
+            self.specs[spec_name] = FeatureSpec(
+                spec_name, func, list(inputs), list(deps), version
+            )
+            return func
+
+        return decorator
+
+    def _order(self, names: Sequence[str]) -> List[List[str]]:
+        """Group ``names`` and their dependencies into topological levels."""
+        level: Dict[str, int] = {}
+
+        def visit(name: str, stack: Tuple[str, ...]) -> int:
+            if name in stack:
+                cycle = " -> ".join(stack + (name,))
+                raise ValueError(f"Cyclic feature dependency: {cycle}")
+            if name not in self.specs:
+                raise KeyError(f"Unknown feature: {name}")
+            if name not in level:
+                spec = self.specs[name]
+                level[name] = 1 + max(
+                    (visit(d, stack + (name,)) for d in spec.deps), default=-1
+                )
+            return level[name]
+
+        for name in names:
+            visit(name, ())
+        n_levels = max(level.values(), default=-1) + 1
+        levels: List[List[str]] = [[] for _ in range(n_levels)]
+        for name, lvl in level.items():
+            levels[lvl].append(name)
+        return levels
+
+    def _split_dir(self, split: str) -> Path:
+        return self.cache_dir / split
+
+    def _read_manifest(self, split: str) -> Dict[str, Dict[str, Any]]:
+        path = self._split_dir(split) / "manifest.json"
+        if not path.exists():
+            return {}
+        with open(path, encoding="utf-8") as f:
+            manifest: Dict[str, Dict[str, Any]] = json.load(f)
+        return manifest
+
+    def _write_manifest(self, split: str, manifest: Dict[str, Dict[str, Any]]) -> None:
+        path = self._split_dir(split) / "manifest.json"
+        tmp = path.with_suffix(".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp, path)
+
+    def _save_column(
+        self, split: str, name: str, values: Any, n_rows: int
+    ) -> Dict[str, Any]:
+        entry: Dict[str, Any] = {}
+        if isinstance(values, pd.DataFrame):
+            raise TypeError(f"Feature '{name}' must return one column, not a DataFrame")
+        if isinstance(getattr(values, "dtype", None), pd.CategoricalDtype):
+            categorical = pd.Categorical(values)
+            entry["categories"] = categorical.categories.tolist()
+            array = categorical.codes
+        else:
+            array = np.asarray(values)
+        if array.dtype == object:
+            raise TypeError(
+                f"Feature '{name}' returned object dtype; return numbers or a "
+                "pandas Categorical"
+            )
+        if array.shape != (n_rows,):
+            raise ValueError(
+                f"Feature '{name}' returned shape {array.shape}, expected ({n_rows},)"
+            )
+        path = self._split_dir(split) / f"{name}.npy"
+        tmp = path.with_suffix(".tmp.npy")
+        np.save(tmp, array)
+        os.replace(tmp, path)
+        entry["dtype"] = str(array.dtype)
+        return entry
+
+    def build(
+        self,
+        df: pd.DataFrame,
+        split: str = "train",
+        names: Optional[Sequence[str]] = None,
+        force: bool = False,
+    ) -> List[str]:
+        """
+        Compute stale features for ``df`` and store them under ``split``.
+
+        Args:
+            df: Raw data for this split
+            split: Cache namespace, e.g. "train" or "test"
+            names: Features to build with their dependencies (default: all)
+            force: Recompute even if the cache is fresh
+
+        Cached features that are no longer registered are removed. If a
+        feature raises, the features that finished before it stay cached.
+
+        Returns:
+            Names of the features that were recomputed
+        """
+        levels = self._order(list(self.specs) if names is None else names)
+        self._split_dir(split).mkdir(parents=True, exist_ok=True)
+        manifest = self._read_manifest(split)
+        orphans = [name for name in manifest if name not in self.specs]
+        for name in orphans:
+            del manifest[name]
+            (self._split_dir(split) / f"{name}.npy").unlink(missing_ok=True)
+        if orphans:
+            self._write_manifest(split, manifest)
+        n_rows = len(df)
+        column_hashes: Dict[str, str] = {}
+        keys: Dict[str, str] = {}
+        rebuilt: List[str] = []
+
+        for level in levels:
+            stale = []
+            for name in level:
+                spec = self.specs[name]
+                for col in spec.inputs:
+                    if col not in column_hashes:
+                        column_hashes[col] = _hash_column(df[col])
+                key_src = json.dumps(
+                    [
+                        spec.source_hash,
+                        spec.version,
+                        n_rows,
+                        [(c, column_hashes[c]) for c in spec.inputs],
+                        [(d, keys[d]) for d in spec.deps],
+                    ]
+                )
+                keys[name] = hashlib.sha256(key_src.encode()).hexdigest()[:16]
+                cached = manifest.get(name, {})
+                is_fresh = (
+                    cached.get("key") == keys[name]
+                    and (self._split_dir(split) / f"{name}.npy").exists()
+                )
+                if force or not is_fresh:
+                    stale.append(name)
+
+            def compute(name: str) -> Dict[str, Any]:
+                spec = self.specs[name]
+                frame = df[spec.inputs].copy()
+                if spec.deps:
+                    deps = self.load(spec.deps, split=split)
+                    deps.index = df.index
+                    frame = pd.concat([frame, deps], axis=1)
+                entry = self._save_column(split, name, spec.func(frame), n_rows)
+                entry["key"] = keys[name]
+                return entry
+
+            n_jobs = (os.cpu_count() or 1) if self.n_jobs == -1 else self.n_jobs
+            workers = max(1, min(n_jobs, len(stale)))
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                futures = [(name, ex.submit(compute, name)) for name in stale]
+            try:
+                for name, future in futures:
+                    if future.exception() is None:
+                        manifest[name] = future.result()
+                        rebuilt.append(name)
+                for _, future in futures:
+                    future.result()
+            finally:
+                # Keep finished siblings even when one feature in the level raised
+                self._write_manifest(split, manifest)
+
+        return rebuilt
+
+    def load(
+        self,
+        names: Optional[Sequence[str]] = None,
+        split: str = "train",
+        mmap: bool = True,
+    ) -> pd.DataFrame:
+        """
+        Load cached features as a DataFrame.
+
+        Args:
+            names: Features to load (default: every registered feature)
+            split: Cache namespace
+            mmap: Memory-map the ``.npy`` files instead of reading them
+
+        Returns:
+            DataFrame with one column per requested feature
+        """
+        manifest = self._read_manifest(split)
+        names = list(self.specs) if names is None else list(names)
+        missing = [n for n in names if n not in manifest]
+        if missing:
+            raise KeyError(f"Features not built for split '{split}': {missing}")
+
+        columns: Dict[str, Any] = {}
+        for name in names:
+            array = np.load(
+                self._split_dir(split) / f"{name}.npy",
+                mmap_mode="r" if mmap else None,
+            )
+            categories = manifest[name].get("categories")
+            if categories is not None:
+                columns[name] = pd.Categorical.from_codes(array, categories)
+            else:
+                columns[name] = array
+        frame: pd.DataFrame = pd.DataFrame(columns, copy=False)
+        return frame
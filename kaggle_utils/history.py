@@ -0,0 +1,357 @@
+"""
+Compact training-history recording for long boosting runs.
+
+A 20k-round run with several folds produces hundreds of thousands of
+metric values. ``HistoryRecorder`` keeps them in typed ``array`` buffers
+(8 bytes per value, cheap appends) and renders a fixed-size, downsampled
+summary that preserves the min/max of every bucket and the best iteration,
+so the report size does not grow with the number of rounds.
+"""
+
+import re
+from array import array
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+# Metric name tokens where a larger value is better
+_HIGHER_IS_BETTER = frozenset(
+    {
+        "auc",
+        "aucpr",
+        "acc",
+        "accuracy",
+        "map",
+        "ndcg",
+        "f1",
+        "gini",
+        "precision",
+        "recall",
+        "r2",
+    }
+)
+
+
+class HistoryBucket(NamedTuple):
+    """Summary of a contiguous range of recorded steps."""
+
+    first_step: int
+    last_step: int
+    min: float
+    max: float
+    last: float
+
+
+class _Series:
+    __slots__ = ("steps", "values", "higher_is_better")
+
+    def __init__(self, higher_is_better: bool):
+        self.steps: "array[int]" = array("q")
+        self.values: "array[float]" = array("d")
+        self.higher_is_better = higher_is_better
+
+
+def _guess_higher_is_better(name: str) -> bool:
+    # Whole tokens only, so "mape" is not read as "map"; "ndcg@5" -> "ndcg"
+    metric = re.sub(r"@\d+$", "", name.rsplit("/", 1)[-1].lower())
+    tokens = re.split(r"[^a-z0-9]+", metric)
+    return any(token in _HIGHER_IS_BETTER for token in tokens)
+
+
+class HistoryRecorder:
+    """Array-backed store for per-iteration training metrics."""
+
+    def __init__(self) -> None:
+        self._series: Dict[str, _Series] = {}
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    @property
+    def names(self) -> List[str]:
+        """Names of all recorded series, in first-seen order."""
+        return list(self._series)
+
+    def _get(self, name: str, higher_is_better: Optional[bool]) -> _Series:
+        series = self._series.get(name)
+        if series is None:
+            if higher_is_better is None:
+                higher_is_better = _guess_higher_is_better(name)
+            series = self._series[name] = _Series(higher_is_better)
+        return series
+
+    def record(
+        self,
+        step: int,
+        values: Mapping[str, float],
+        higher_is_better: Optional[bool] = None,
+    ) -> None:
+        """
+        Record metric values for one training step.
+
+        Args:
+            step: Iteration / epoch number
+            values: Mapping of series name to value
+            higher_is_better: Direction used for new series; guessed from the
+                metric name when None
+        """
+        for name, value in values.items():
+            series = self._get(name, higher_is_better)
+            series.steps.append(step)
+            series.values.append(value)
+
+    def series(self, name: str) -> Tuple["array[int]", "array[float]"]:
+        """Return the (steps, values) arrays of a series."""
+        series = self._series[name]
+        return series.steps, series.values
+
+    def best(self, name: str) -> Tuple[int, float]:
+        """Return (step, value) of the best recorded value of a series."""
+        series = self._series[name]
+        pick = max if series.higher_is_better else min
+        idx = pick(range(len(series.values)), key=series.values.__getitem__)
+        return series.steps[idx], series.values[idx]
+
+    def downsample(self, name: str, n_buckets: int = 20) -> List[HistoryBucket]:
+        """
+        Split a series into at most ``n_buckets`` equal ranges of steps.
+
+        Args:
+            name: Series name
+            n_buckets: Maximum number of buckets
+
+        Returns:
+            One HistoryBucket per non-empty range
+        """
+        steps, values = self.series(name)
+        n = len(values)
+        n_buckets = max(1, min(n_buckets, n))
+        buckets = []
+        for i in range(n_buckets):
+            lo = i * n // n_buckets
+            hi = (i + 1) * n // n_buckets
+            if lo == hi:
+                continue
+            chunk = values[lo:hi]
+            buckets.append(
+                HistoryBucket(
+                    steps[lo], steps[hi - 1], min(chunk), max(chunk), chunk[-1]
+                )
+            )
+        return buckets
+
+    def to_markdown(self, n_buckets: int = 20) -> str:
+        """
+        Render every series as a downsampled markdown table.
+
+        Args:
+            n_buckets: Maximum number of rows per series
+
+        Returns:
+            Markdown text whose size is independent of the number of steps
+        """
+        lines = []
+        for name in self._series:
+            steps, values = self.series(name)
+            if not values:
+                continue
+            best_step, best_value = self.best(name)
+            lines.append(
+                f"### {name} ({len(values)} steps, best {best_value:.6g} "
+                f"at step {best_step})\n"
+            )
+            lines.append("| Steps | Min | Max | Last |")
+            lines.append("|-------|-----|-----|------|")
+            for b in self.downsample(name, n_buckets):
+                is_best = b.first_step <= best_step <= b.last_step
+                marker = " **best**" if is_best else ""
+                lines.append(
+                    f"| {b.first_step}-{b.last_step}{marker} | {b.min:.6g} "
+                    f"| {b.max:.6g} | {b.last:.6g} |"
+                )
+            lines.append("")
+        return "\n".join(lines)
+
+    # ------------------------------------------------------------------
+    # Framework callbacks
+    # ------------------------------------------------------------------
+
+    def lightgbm_callback(self, prefix: str = "") -> Callable[[Any], None]:
+        """
+        Create a LightGBM callback that streams evaluation results.
+
+        Args:
+            prefix: Prepended to every series name, e.g. ``"fold0/"``
+
+        Returns:
+            Callback for ``lgb.train(..., callbacks=[...])`` / ``lgb.cv``
+        """
+
+        def _callback(env: Any) -> None:
+            step = env.iteration + 1
+            for item in env.evaluation_result_list:
+                data_name, eval_name, result, higher_is_better = item[:4]
+                name = f"{prefix}{data_name}/{eval_name}"
+                series = self._get(name, higher_is_better)
+                series.steps.append(step)
+                series.values.append(result)
+
+        _callback.order = 30  # type: ignore[attr-defined]
+        return _callback
+
+    def xgboost_callback(self, prefix: str = "") -> Any:
+        """
+        Create an XGBoost TrainingCallback that streams evaluation results.
+
+        Args:
+            prefix: Prepended to every series name, e.g. ``"fold0/"``
+
+        Returns:
+            Callback for ``xgb.train(..., callbacks=[...])``
+        """
+        from xgboost.callback import TrainingCallback
+
+        recorder = self
+
+        class _Callback(TrainingCallback):  # type: ignore[misc]
+            def after_iteration(self, model: Any, epoch: int, evals_log: Any) -> bool:
+                for data_name, metrics in evals_log.items():
+                    for metric_name, log in metrics.items():
+                        value = log[-1]
+                        if isinstance(value, tuple):  # xgb.cv logs (mean, std)
+                            value = value[0]
+                        name = f"{prefix}{data_name}/{metric_name}"
+                        series = recorder._get(name, None)
+                        series.steps.append(epoch + 1)
+                        series.values.append(value)
+                return False
+
+        return _Callback()
+
+    # ------------------------------------------------------------------
+    # Conversion and persistence
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_records(cls, records: Iterable[Any]) -> "HistoryRecorder":
+        """
+        Build a recorder from a list of per-epoch values.
+
+        Args:
+            records: Per-epoch dicts of numeric values, sequences of numbers
+                (recorded as ``value_0``, ``value_1``, ...), or plain numbers
+
+        Returns:
+            Recorder with steps numbered from 1
+
+        Raises:
+            TypeError: If a record contains non-numeric values
+        """
+        recorder = cls()
+        for step, values in enumerate(records, start=1):
+            if isinstance(values, Mapping):
+                recorder.record(step, values)
+            elif isinstance(values, (str, bytes)):
+                raise TypeError(f"Non-numeric history record: {values!r}")
+            elif isinstance(values, Iterable):
+                recorder.record(step, {f"value_{i}": v for i, v in enumerate(values)})
+            else:
+                recorder.record(step, {"value": values})
+        return recorder
+
+    @classmethod
+    def from_evals_result(cls, evals_result: Mapping[Any, Any]) -> "HistoryRecorder":
+        """
+        Build a recorder from a mapping of per-round metric lists.
+
+        Accepts the nested ``{data_name: {metric: [...]}}`` shape of LightGBM
+        ``evals_result_`` and XGBoost ``evals_result()``, and the flat
+        ``{metric: [...]}`` shape of Keras ``History.history`` and ``lgb.cv``.
+
+        Args:
+            evals_result: Nested or flat mapping of metric value sequences
+
+        Returns:
+            Recorder with series named ``data_name/metric`` (or ``metric``)
+            and steps numbered from 1
+
+        Raises:
+            TypeError: If a leaf is not a sequence of numbers
+        """
+        recorder = cls()
+        for data_name, entry in evals_result.items():
+            if isinstance(entry, Mapping):
+                items = [(f"{data_name}/{m}", values) for m, values in entry.items()]
+            else:
+                items = [(str(data_name), entry)]
+            for name, values in items:
+                if isinstance(values, (str, bytes, Mapping)) or not isinstance(
+                    values, Iterable
+                ):
+                    raise TypeError(f"History series {name!r} is not a sequence")
+                series = recorder._get(name, None)
+                for step, value in enumerate(values, start=1):
+                    series.steps.append(step)
+                    series.values.append(value)
+        return recorder
+
+    def save(self, path: Path) -> Path:
+        """
+        Save all series to a compressed ``.npz`` file.
+
+        Args:
+            path: Output path
+
+        Returns:
+            Path to the saved file
+        """
+        import numpy as np
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        arrays: Dict[str, Any] = {
+            "names": np.array(self.names, dtype=str),
+            "higher_is_better": np.array(
+                [s.higher_is_better for s in self._series.values()], dtype=bool
+            ),
+        }
+        for i, series in enumerate(self._series.values()):
+            arrays[f"steps_{i}"] = np.frombuffer(series.steps, dtype=np.int64)
+            arrays[f"values_{i}"] = np.frombuffer(series.values, dtype=np.float64)
+        with open(path, "wb") as f:
+            np.savez_compressed(f, **arrays)
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> "HistoryRecorder":
+        """
+        Load a recorder previously written by ``save``.
+
+        Args:
+            path: Path to the ``.npz`` file
+
+        Returns:
+            Restored recorder
+        """
+        import numpy as np
+
+        recorder = cls()
+        with np.load(path) as data:
+            for i, (name, higher) in enumerate(
+                zip(data["names"], data["higher_is_better"])
+            ):
+                series = recorder._get(str(name), bool(higher))
+                series.steps.frombytes(data[f"steps_{i}"].astype(np.int64).tobytes())
+                series.values.frombytes(
+                    data[f"values_{i}"].astype(np.float64).tobytes()
+                )
+        return recorder
@@ -4,12 +4,22 @@ Reporting utilities for generating Claude-friendly experiment reports.
 This module provides tools to create structured markdown reports
 that can be easily read and analyzed by Claude Code locally after
 being synced from Google Drive.
+
+pandas is only needed for type annotations here, so it is not imported at
+runtime; ``ExperimentReporter`` stays cheap to import for CLI use.
 """
 
+from __future__ import annotations
+
+from dataclasses import asdict, is_dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
-import pandas as pd
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+from .history import HistoryRecorder
 
 
 class ExperimentReporter:
@@ -84,17 +94,23 @@ def generate_full_report(
     feature_importance: Optional[pd.DataFrame] = None,
     plots_dir: Optional[Path] = None,
     output_path: Optional[Path] = None,
+    history_buckets: int = 20,
 ) -> Path:
     """
     Generate comprehensive analysis report with all experiment details.
 
     Args:
         experiment_name: Name of the experiment
-        metrics: Dictionary containing all metrics
+        metrics: Dictionary containing all metrics. ``confidence_intervals``
+            may map labels to kaggle_utils.metrics bootstrap results (or
+            their dict form)
         config: Experiment configuration
         feature_importance: DataFrame with feature importance (columns: feature, importance)
         plots_dir: Directory containing plot images
         output_path: Path to save the report
+        history_buckets: Maximum rows per series when ``metrics["history"]``
+            is a HistoryRecorder, or a list or ``evals_result_``-style dict
+            of series longer than this
 
     Returns:
         Path to the generated report
@@ -139,6 +155,31 @@ def generate_full_report(
             )
         f.write("\n")
 
+        # Bootstrap Confidence Intervals
+        intervals = metrics.get("confidence_intervals") or {}
+        if intervals:
+            f.write("## Confidence Intervals\n\n")
+            f.write("| Metric | Estimate | CI | Details |\n")
+            f.write("|--------|----------|----|---------|\n")
+            for label, result in intervals.items():
+                if is_dataclass(result) and not isinstance(result, type):
+                    r = asdict(result)
+                else:
+                    r = dict(result)
+                ci = f"{r['confidence']:.0%} [{r['low']:.6f}, {r['high']:.6f}]"
+                if "delta" in r:
+                    f.write(
+                        f"| {label} | Δ {r['delta']:+.6f} | {ci} "
+                        f"| {r['score_a']:.6f} → {r['score_b']:.6f}, "
+                        f"P(better) = {r['prob_better']:.1%} |\n"
+                    )
+                else:
+                    f.write(
+                        f"| {label} | {r['score']:.6f} | {ci} "
+                        f"| std {r['std']:.6f}, n = {r['n_resamples']} |\n"
+                    )
+            f.write("\n")
+
         # Feature Importance
         if feature_importance is not None and len(feature_importance) > 0:
             f.write("## Top 20 Features\n\n")
@@ -165,14 +206,44 @@ def generate_full_report(
         # Training History
         if "history" in metrics:
             f.write("## Training History\n\n")
-            f.write("```\n")
             history = metrics["history"]
-            if isinstance(history, list):
-                for epoch, values in enumerate(history):
-                    f.write(f"Epoch {epoch+1}: {values}\n")
+            if isinstance(history, list) and len(history) > history_buckets:
+                # Long histories are downsampled so report size stays bounded
+                try:
+                    history = HistoryRecorder.from_records(history)
+                except TypeError:
+                    pass
+            elif isinstance(history, Mapping):
+                # evals_result_ / History.history: {data: {metric: [...]}}
+                try:
+                    recorder = HistoryRecorder.from_evals_result(history)
+                except TypeError:
+                    pass
+                else:
+                    lengths = [len(recorder.series(n)[1]) for n in recorder.names]
+                    if max(lengths, default=0) > history_buckets:
+                        history = recorder
+            if isinstance(history, HistoryRecorder):
+                f.write(history.to_markdown(history_buckets))
+                f.write("\n")
             else:
-                f.write(str(history))
-            f.write("\n```\n\n")
+                f.write("```\n")
+                if isinstance(history, list):
+                    # Non-numeric records: keep the first and last epochs
+                    n_head = (history_buckets + 1) // 2
+                    n_tail = history_buckets - n_head
+                    if len(history) <= history_buckets:
+                        n_head, n_tail = len(history), 0
+                    for epoch in range(n_head):
+                        f.write(f"Epoch {epoch+1}: {history[epoch]}\n")
+                    omitted = len(history) - n_head - n_tail
+                    if omitted:
+                        f.write(f"... ({omitted} epochs omitted)\n")
+                        for epoch in range(len(history) - n_tail, len(history)):
+                            f.write(f"Epoch {epoch+1}: {history[epoch]}\n")
+                else:
+                    f.write(str(history))
+                f.write("\n```\n\n")
 
         # Observations
         f.write("## Observations\n\n")
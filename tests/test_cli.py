@@ -0,0 +1,139 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from kaggle_utils.cli import main
+from kaggle_utils.discussions import load_discussions, search_discussions
+from kaggle_utils.history import HistoryRecorder
+
+
+def write_json(path: Path, data: object) -> Path:
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+def test_report_with_metrics_and_history(tmp_path: Path, capsys):
+    metrics = write_json(tmp_path / "metrics.json", {"val_score": 0.8123})
+    config = write_json(tmp_path / "config.json", {"model_type": "lightgbm"})
+    recorder = HistoryRecorder()
+    for step in range(1, 1001):
+        recorder.record(step, {"valid/auc": 1 - 1 / (step + 1)})
+    history = recorder.save(tmp_path / "history.npz")
+    output = tmp_path / "report.md"
+
+    code = main(
+        [
+            "report",
+            "exp001",
+            "--metrics",
+            str(metrics),
+            "--config",
+            str(config),
+            "--history",
+            str(history),
+            "--output",
+            str(output),
+        ]
+    )
+
+    assert code == 0
+    assert capsys.readouterr().out.strip() == str(output)
+    text = output.read_text()
+    assert "**Validation Score:** 0.8123" in text
+    assert "model_type: lightgbm" in text
+    assert "### valid/auc (1000 steps, best" in text
+
+
+@pytest.mark.parametrize(
+    "content, message",
+    [
+        (None, "no such file or directory"),
+        ("[1, 2]", "expected a JSON object"),
+        ("{bad", "Expecting property name"),
+    ],
+)
+def test_bad_metrics_file_is_a_usage_error(tmp_path: Path, capsys, content, message):
+    path = tmp_path / "metrics.json"
+    if content is not None:
+        path.write_text(content, encoding="utf-8")
+
+    with pytest.raises(SystemExit) as exc:
+        main(["report", "x", "--metrics", str(path), "-o", str(tmp_path / "r.md")])
+
+    assert exc.value.code == 2
+    err = capsys.readouterr().err
+    assert message in err
+    assert "Traceback" not in err
+
+
+def test_fetch_discussions_is_dispatched_to_the_scraper(capsys):
+    with pytest.raises(SystemExit) as exc:
+        main(["fetch-discussions"])
+    assert exc.value.code == 2
+    err = capsys.readouterr().err
+    assert "kaggle-utils fetch-discussions" in err
+    assert "competition slug is not set" in err
+
+
+def make_forum() -> dict[str, dict]:
+    def comment(content: str, *replies: dict) -> dict:
+        return {"content": content, "replies": list(replies)}
+
+    return {
+        "1": {
+            "title": "Target leak in the id column",
+            "voteCount": 5,
+            "comments": [comment("the leak is real"), comment("unrelated")],
+        },
+        "2": {
+            "title": "Validation strategy",
+            "voteCount": 50,
+            "comments": [comment("watch the target leak", comment("Target LEAK!"))],
+        },
+        "3": {
+            "title": "Public notebook",
+            "voteCount": 99,
+            "comments": [comment("nice target leak writeup")],
+        },
+        "4": {"title": "Nothing here", "voteCount": 100, "comments": []},
+    }
+
+
+def test_search_ranks_by_matches_then_votes():
+    hits = search_discussions(make_forum(), "target LEAK")
+
+    assert [h["id"] for h in hits] == ["2", "3", "1"]
+    assert [h["matches"] for h in hits] == [2, 1, 1]
+    assert "target leak" in hits[1]["snippet"]
+
+
+def test_search_limit_and_topic_meta():
+    meta = {"1": {"title": "Target leak (edited)", "votes": 500}}
+    hits = search_discussions(make_forum(), "target leak", meta, limit=2)
+
+    assert [h["id"] for h in hits] == ["2", "1"]
+    assert hits[1]["title"] == "Target leak (edited)"
+    assert len(search_discussions(make_forum(), "target leak", limit=0)) == 3
+
+
+def test_search_command_reads_saved_discussions(tmp_path: Path, capsys):
+    write_json(tmp_path / "discussions_full.json", {"topics": make_forum()})
+    write_json(
+        tmp_path / "topic_list.json", {"topics": [{"id": 3, "title": "Renamed"}]}
+    )
+    details, meta = load_discussions(tmp_path)
+    assert meta["3"]["title"] == "Renamed"
+
+    assert main(["search", "leak", "--input", str(tmp_path), "--limit", "1"]) == 0
+    out = capsys.readouterr().out
+    assert out.startswith("[2] Validation strategy (votes: 50, matches: 2)")
+    assert out.count("\n[") == 0
+
+
+@pytest.mark.parametrize("module", ["kaggle_utils.cli", "kaggle_utils.reporting"])
+def test_import_does_not_load_pandas(module: str):
+    code = f"import sys, {module}; sys.exit('pandas' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
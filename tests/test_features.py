@@ -0,0 +1,141 @@
+import functools
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from kaggle_utils.features import FeatureStore
+
+
+def make_store(tmp_path: Path) -> FeatureStore:
+    store = FeatureStore(str(tmp_path / "features"), n_jobs=2)
+
+    @store.feature(inputs=["SibSp", "Parch"])
+    def family_size(df):
+        return df["SibSp"] + df["Parch"] + 1
+
+    @store.feature(deps=["family_size"])
+    def is_alone(df):
+        return (df["family_size"] == 1).astype("int8")
+
+    @store.feature(inputs=["Fare"])
+    def log_fare(df):
+        return np.log1p(df["Fare"])
+
+    return store
+
+
+def make_frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "SibSp": [0, 1, 0, 3],
+            "Parch": [0, 0, 2, 1],
+            "Fare": [7.25, 71.3, 8.05, 53.1],
+        }
+    )
+
+
+def test_first_build_computes_everything_then_nothing(tmp_path):
+    store = make_store(tmp_path)
+    df = make_frame()
+    assert sorted(store.build(df)) == ["family_size", "is_alone", "log_fare"]
+    assert store.build(df) == []
+
+    loaded = store.load(split="train")
+    assert list(loaded.columns) == ["family_size", "is_alone", "log_fare"]
+    assert loaded["is_alone"].tolist() == [1, 0, 0, 0]
+
+
+def test_code_change_recomputes_feature_and_dependents(tmp_path):
+    store = make_store(tmp_path)
+    df = make_frame()
+    store.build(df)
+
+    @store.feature(name="family_size", inputs=["SibSp", "Parch"])
+    def family_size_v2(df):
+        return df["SibSp"] + df["Parch"]
+
+    assert sorted(store.build(df)) == ["family_size", "is_alone"]
+    assert store.load(["family_size"])["family_size"].tolist() == [0, 1, 2, 4]
+
+
+def test_input_change_recomputes_only_readers(tmp_path):
+    store = make_store(tmp_path)
+    df = make_frame()
+    store.build(df)
+
+    df.loc[0, "Fare"] = 10.0
+    assert store.build(df) == ["log_fare"]
+
+
+def test_dependency_change_recomputes_dependents(tmp_path):
+    store = make_store(tmp_path)
+    df = make_frame()
+    store.build(df)
+
+    df.loc[0, "Parch"] = 1
+    assert sorted(store.build(df)) == ["family_size", "is_alone"]
+
+
+def test_version_bump_and_force(tmp_path):
+    store = make_store(tmp_path)
+    df = make_frame()
+    store.build(df)
+
+    store.specs["log_fare"].version = "2"
+    assert store.build(df) == ["log_fare"]
+    assert store.build(df, names=["log_fare"], force=True) == ["log_fare"]
+
+
+def test_orphans_are_pruned_and_not_loaded(tmp_path):
+    store = make_store(tmp_path)
+    df = make_frame()
+    store.build(df)
+
+    del store.specs["log_fare"]
+    store.build(df)
+    assert list(store.load(split="train").columns) == ["family_size", "is_alone"]
+    assert not (tmp_path / "features" / "train" / "log_fare.npy").exists()
+    with pytest.raises(KeyError):
+        store.load(["log_fare"])
+
+
+def test_failing_feature_keeps_finished_siblings(tmp_path):
+    store = make_store(tmp_path)
+
+    @store.feature(inputs=["Fare"])
+    def broken(df):
+        raise RuntimeError("boom")
+
+    df = make_frame()
+    with pytest.raises(RuntimeError, match="boom"):
+        store.build(df)
+
+    del store.specs["broken"]
+    # family_size and log_fare share broken's level and were recorded
+    assert store.build(df) == ["is_alone"]
+
+
+def test_code_change_without_source_file_recomputes(tmp_path):
+    # exec'd functions have no source for inspect.getsource to find
+    store = FeatureStore(str(tmp_path / "features"))
+    df = make_frame()
+    namespace: dict = {}
+    for increment in (1, 2):
+        source = f"def fare_plus(df):\n    return df['Fare'] + {increment}\n"
+        exec(compile(source, "<string>", "exec"), namespace)
+        store.feature(inputs=["Fare"])(namespace["fare_plus"])
+        assert store.build(df) == ["fare_plus"]
+    assert store.load()["fare_plus"].tolist() == (df["Fare"] + 2).tolist()
+
+
+def test_callable_without_code_needs_version(tmp_path):
+    store = FeatureStore(str(tmp_path / "features"))
+    scaled = functools.partial(lambda df, k: df["Fare"] * k, k=2)
+    store.feature(name="fare_x2", inputs=["Fare"])(scaled)
+    with pytest.raises(TypeError, match="version="):
+        store.build(make_frame())
+
+    store.feature(name="fare_x2", inputs=["Fare"], version="1")(scaled)
+    assert store.build(make_frame()) == ["fare_x2"]
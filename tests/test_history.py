@@ -0,0 +1,132 @@
+from pathlib import Path
+
+import pytest
+
+from kaggle_utils.history import HistoryRecorder
+from kaggle_utils.reporting import generate_full_report
+
+
+def make_recorder() -> HistoryRecorder:
+    recorder = HistoryRecorder()
+    for step in range(1, 101):
+        # valid loss dips to its minimum at step 37, spikes at step 90
+        valid = abs(step - 37) / 100 + (5.0 if step == 90 else 0.0)
+        recorder.record(step, {"valid/l2": valid, "valid/auc": step / 100})
+    return recorder
+
+
+def test_best_follows_metric_direction():
+    recorder = make_recorder()
+    assert recorder.best("valid/l2") == (37, 0.0)
+    assert recorder.best("valid/auc") == (100, 1.0)
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("valid_0/auc", True),
+        ("val_accuracy", True),
+        ("valid/ndcg@5", True),
+        ("valid/map", True),
+        ("valid_0/mape", False),
+        ("val_mape", False),
+        ("valid/binary_logloss", False),
+        ("train/rmse", False),
+    ],
+)
+def test_direction_guess_matches_whole_tokens(name, expected):
+    recorder = HistoryRecorder()
+    recorder.record(1, {name: 0.5})
+    recorder.record(2, {name: 0.9})
+    assert recorder.best(name)[0] == (2 if expected else 1)
+
+
+def test_downsample_preserves_extremes():
+    recorder = make_recorder()
+    buckets = recorder.downsample("valid/l2", n_buckets=10)
+
+    assert len(buckets) == 10
+    assert buckets[0].first_step == 1
+    assert buckets[-1].last_step == 100
+    assert min(b.min for b in buckets) == 0.0
+    assert max(b.max for b in buckets) == pytest.approx(5.53)
+    spike = next(b for b in buckets if b.first_step <= 90 <= b.last_step)
+    assert spike.max == pytest.approx(5.53)
+
+
+def test_downsample_short_series_has_one_bucket_per_step():
+    recorder = HistoryRecorder()
+    for step in range(1, 4):
+        recorder.record(step, {"loss": float(step)})
+    assert [b.first_step for b in recorder.downsample("loss", 20)] == [1, 2, 3]
+
+
+def test_save_load_round_trip(tmp_path: Path):
+    recorder = make_recorder()
+    loaded = HistoryRecorder.load(recorder.save(tmp_path / "history.npz"))
+
+    assert loaded.names == recorder.names
+    for name in recorder.names:
+        assert list(loaded.series(name)[0]) == list(recorder.series(name)[0])
+        assert list(loaded.series(name)[1]) == list(recorder.series(name)[1])
+        assert loaded.best(name) == recorder.best(name)
+
+
+def test_from_records_accepts_sequences():
+    recorder = HistoryRecorder.from_records([[1.0, 2.0], (0.5, 1.5), [0.7, 1.0]])
+    assert recorder.names == ["value_0", "value_1"]
+    assert recorder.best("value_0") == (2, 0.5)
+    assert recorder.best("value_1") == (3, 1.0)
+
+
+def test_report_size_is_bounded(tmp_path: Path):
+    history = [[1 / (i + 1), 2 / (i + 1)] for i in range(10_000)]
+    short = generate_full_report(
+        "x", {"history": history[:100]}, {}, output_path=tmp_path / "short.md"
+    )
+    long = generate_full_report(
+        "x", {"history": history}, {}, output_path=tmp_path / "long.md"
+    )
+    assert "Epoch" not in long.read_text()
+    assert long.stat().st_size < 2 * short.stat().st_size
+
+
+def test_report_keeps_head_and_tail_of_non_numeric_history(tmp_path: Path):
+    history = [f"epoch-{i}" for i in range(1, 101)]
+    path = generate_full_report(
+        "x", {"history": history}, {}, output_path=tmp_path / "r.md"
+    )
+    text = path.read_text()
+    assert "Epoch 1: epoch-1\n" in text
+    assert "Epoch 100: epoch-100\n" in text
+    assert "(80 epochs omitted)" in text
+
+
+def test_from_evals_result_accepts_nested_and_flat_shapes():
+    nested = HistoryRecorder.from_evals_result(
+        {"training": {"auc": [0.7, 0.8]}, "valid_0": {"auc": [0.6, 0.65, 0.64]}}
+    )
+    assert nested.names == ["training/auc", "valid_0/auc"]
+    assert nested.best("valid_0/auc") == (2, 0.65)
+
+    flat = HistoryRecorder.from_evals_result({"loss": [0.9, 0.5], "val_loss": [1.0]})
+    assert flat.names == ["loss", "val_loss"]
+    assert flat.best("loss") == (2, 0.5)
+
+    with pytest.raises(TypeError):
+        HistoryRecorder.from_evals_result({"valid_0": {"auc": "0.7"}})
+
+
+def test_report_size_is_bounded_for_evals_result(tmp_path: Path):
+    def evals_result(n_rounds: int) -> dict:
+        return {"valid_0": {"auc": [1 - 1 / (i + 2) for i in range(n_rounds)]}}
+
+    short = generate_full_report(
+        "x", {"history": evals_result(100)}, {}, output_path=tmp_path / "short.md"
+    )
+    long = generate_full_report(
+        "x", {"history": evals_result(20_000)}, {}, output_path=tmp_path / "long.md"
+    )
+    text = long.read_text()
+    assert "### valid_0/auc (20000 steps" in text
+    assert long.stat().st_size < 2 * short.stat().st_size
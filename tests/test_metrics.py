@@ -0,0 +1,158 @@
+import numpy as np
+import pytest
+from sklearn import metrics as skm
+
+from kaggle_utils import metrics
+from kaggle_utils.metrics import (
+    bootstrap_ci,
+    bootstrap_indices,
+    grouped_scores,
+    paired_bootstrap,
+    weighted_mean,
+)
+from kaggle_utils.reporting import generate_full_report
+
+
+def make_data(n: int = 500, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    y = rng.integers(0, 2, n)
+    # Rounding creates many tied scores
+    preds = np.round(np.clip(0.3 * y + 0.7 * rng.random((3, n)), 0.01, 0.99), 2)
+    return y, preds
+
+
+SKLEARN = {
+    "rmse": lambda y, p: np.sqrt(skm.mean_squared_error(y, p)),
+    "mae": skm.mean_absolute_error,
+    "log_loss": lambda y, p: skm.log_loss(y, p, labels=[0, 1]),
+    "auc": skm.roc_auc_score,
+    "f1": lambda y, p: skm.f1_score(y, p >= 0.5, zero_division=0.0),
+}
+
+
+@pytest.mark.parametrize("name", sorted(SKLEARN))
+def test_matches_sklearn_on_every_resample(name):
+    y, preds = make_data()
+    fn = metrics.METRICS[name][0]
+    idx = next(bootstrap_indices(len(y), n_resamples=20, seed=1))
+
+    scores = fn(y, preds, idx)
+    assert scores.shape == (3, 20)
+    expected = [[SKLEARN[name](y[i], p[i]) for i in idx] for p in preds]
+    np.testing.assert_allclose(scores, expected, rtol=1e-10)
+    np.testing.assert_allclose(fn(y, preds[0]), SKLEARN[name](y, preds[0]))
+
+
+def test_auc_averages_ties():
+    y = np.array([0, 1, 0, 1, 1, 0])
+    p = np.array([0.5, 0.5, 0.2, 0.8, 0.5, 0.5])
+    assert metrics.auc(y, p) == pytest.approx(skm.roc_auc_score(y, p))
+    assert metrics.auc(y, np.full(6, 0.3)) == pytest.approx(0.5)
+
+
+def test_f1_without_positives_or_hits_is_zero():
+    y = np.zeros(4)
+    p = np.full(4, 0.1)
+    assert metrics.f1(y, p) == 0.0
+    assert metrics.f1(y, np.stack([p, p]), np.array([[0, 1], [2, 3]])).tolist() == [
+        [0.0, 0.0],
+        [0.0, 0.0],
+    ]
+
+
+def test_single_class_resample_is_nan():
+    y = np.array([0, 0, 1, 1])
+    p = np.array([0.1, 0.4, 0.35, 0.8])
+    idx = np.array([[0, 1, 0, 1], [0, 2, 1, 3], [2, 3, 3, 2]])
+    scores = metrics.auc(y, p, idx)
+    assert np.isnan(scores[0]) and np.isnan(scores[2])
+    assert scores[1] == pytest.approx(skm.roc_auc_score(y[idx[1]], p[idx[1]]))
+
+
+def test_paired_bootstrap_prob_better():
+    y, preds = make_data(n=2000)
+    weak = np.full(len(y), 0.5)
+    result = paired_bootstrap("auc", y, weak, preds[0], n_resamples=200)
+    assert result.prob_better == 1.0
+    assert result.low > 0
+
+    same = paired_bootstrap("rmse", y, preds[0], preds[0], n_resamples=50)
+    assert same.prob_better == 0.0
+    assert same.delta == 0.0
+
+
+def test_batching_does_not_change_scores():
+    y, preds = make_data(n=300)
+    one = paired_bootstrap("auc", y, preds[0], preds[1], n_resamples=40, batch_size=40)
+    many = paired_bootstrap("auc", y, preds[0], preds[1], n_resamples=40, batch_size=7)
+    assert one == many
+
+
+def test_grouped_scores_shapes():
+    y, preds = make_data(n=300)
+    folds = np.arange(300) % 3
+    single = grouped_scores("rmse", y, preds[0], folds)
+    assert sorted(single) == [0, 1, 2]
+    assert isinstance(single[0], float)
+    assert single[1] == pytest.approx(SKLEARN["rmse"](y[1::3], preds[0, 1::3]))
+
+    multi = grouped_scores("auc", y, preds, folds)
+    assert np.shape(multi[2]) == (3,)
+
+
+def test_custom_metric_with_weighted_mean():
+    y, preds = make_data(n=300)
+    y = y + 1.0
+
+    def mape(y_true, y_pred, indices=None):
+        return weighted_mean(np.abs(y_pred - y_true) / np.abs(y_true), indices)
+
+    idx = next(bootstrap_indices(len(y), n_resamples=5, seed=2))
+    expected = [
+        [skm.mean_absolute_percentage_error(y[i], p[i]) for i in idx] for p in preds
+    ]
+    np.testing.assert_allclose(mape(y, preds, idx), expected)
+
+    result = paired_bootstrap(
+        mape, y, preds[0], preds[1], n_resamples=50, higher_is_better=False
+    )
+    assert result.metric == "mape"
+    assert result.delta == pytest.approx(
+        skm.mean_absolute_percentage_error(y, preds[1])
+        - skm.mean_absolute_percentage_error(y, preds[0])
+    )
+
+
+def test_report_confidence_intervals_table(tmp_path):
+    y, preds = make_data(n=500)
+    ci = bootstrap_ci("auc", y, preds[0], n_resamples=100)
+    cmp = paired_bootstrap("auc", y, preds[0], preds[1], n_resamples=100)
+    as_dict = {
+        "metric": "rmse",
+        "score": 0.25,
+        "low": 0.2,
+        "high": 0.3,
+        "std": 0.025,
+        "n_resamples": 10,
+        "confidence": 0.9,
+    }
+    path = generate_full_report(
+        "x",
+        {"confidence_intervals": {"auc": ci, "auc: b vs a": cmp, "rmse": as_dict}},
+        {},
+        output_path=tmp_path / "r.md",
+    )
+    text = path.read_text()
+
+    assert "## Confidence Intervals" in text
+    assert (
+        f"| auc | {ci.score:.6f} | 95% [{ci.low:.6f}, {ci.high:.6f}] "
+        f"| std {ci.std:.6f}, n = 100 |" in text
+    )
+    assert (
+        f"| auc: b vs a | Δ {cmp.delta:+.6f} | 95% [{cmp.low:.6f}, {cmp.high:.6f}] "
+        f"| {cmp.score_a:.6f} → {cmp.score_b:.6f}, "
+        f"P(better) = {cmp.prob_better:.1%} |" in text
+    )
+    dict_row = "| rmse | 0.250000 | 90% [0.200000, 0.300000] | std 0.025000, n = 10 |"
+    assert dict_row in text